@@ -7,34 +7,92 @@ Scans system block devices and LVM configuration,
 and displays in a curses UI with detailed information about
 Volume Groups, Logical Volumes, and Physical Volumes.
 """
+import collections
+import concurrent.futures
 import curses
+import functools
 import json
 import os
 import re
 import subprocess
 import shlex
+import sys
 
+# Precompiled parse patterns; these run per line of fdisk/parted output
+_DISK_RE = re.compile(r'Disk (/[^:]+):')
+
+# Matches one LV device segment, e.g. "/dev/sda1(123)" -> ("/dev/sda1", "123")
+_PV_SEG_RE = re.compile(r'\s*([^()]+?)\s*\((\d+)\)\s*$')
+
+# Bound once so the LV table rows and header share one parsed format
+_ROW_FMT = "{:<10} {:<10} {:>10} {:>10} {:<20} {}".format
+
+# Interned sentinel: every fallback below assigns this exact object, so
+# the hot row code can compare identity instead of characters
+_NA = sys.intern("N/A")
+
+def _clip6(s):
+    """Clip a block device table field to 6 chars, marking the cut."""
+    return s if len(s) <= 6 else s[:5] + "."
+
+
+# On-disk cache of the discovery results; invalidated when block device or
+# LVM configuration state changes
+CACHE_PATH = os.path.expanduser('~/.cache/lvm_tooler/state.json')
+
+def cache_key():
+    """Return mtimes that change whenever the device/LVM topology does.
+
+    /sys/block catches disks and partitions appearing or vanishing,
+    /run/lvm catches LVM metadata operations, and lvm.conf catches
+    configuration edits. /proc pseudo-files are deliberately not used:
+    many kernels report the current time for their mtime, which would
+    defeat the cache entirely.
+    """
+    key = []
+    for path in ('/sys/block', '/run/lvm', '/etc/lvm/lvm.conf'):
+        try:
+            key.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            key.append(0)
+    return key
+
+# Process-lifetime cache layered above the on-disk one; repeat calls with
+# an unchanged topology key skip even the cache-file read and JSON parse
+_mem_cache = {'key': None, 'data': None}
+
+@functools.lru_cache(maxsize=4096)
 def format_size(size_bytes):
-    """Format size in bytes to human-readable KiB, MiB, GiB, TiB."""
+    """Format size in bytes to human-readable KiB, MiB, GiB, TiB.
+
+    Sizes repeat heavily across redraws (LV/PV/VG sizes don't change
+    between keystrokes), so results are memoized.
+    """
     try:
         size = float(size_bytes)
-    except (TypeError, ValueError):
+        whole = int(size)
+    except (TypeError, ValueError, OverflowError):
         return 'N/A'
-    for unit in ['B', 'KiB', 'MiB', 'GiB', 'TiB']:
-        if size < 1024 or unit == 'TiB':
-            # Format with consistent decimal alignment
-            if size < 10:
-                return f"  {size:.2f} {unit}"  # Two spaces for single digit
-            elif size < 100:
-                return f" {size:.2f} {unit}"   # One space for double digit
-            else:
-                return f"{size:.2f} {unit}"    # No space for triple+ digit
-        size /= 1024.0
+    # Pick the unit straight from the magnitude's bit length rather than
+    # dividing in a loop; each 10 bits is one binary order of magnitude
+    idx = min(4, max(0, (abs(whole).bit_length() - 1) // 10))
+    size /= 1 << (idx * 10)
+    unit = ('B', 'KiB', 'MiB', 'GiB', 'TiB')[idx]
+    # The 6-wide format keeps the decimal alignment of the old
+    # one/two/three-digit padding branches
+    return f"{size:>6.2f} {unit}"
+
+# All external tools run under the C locale: the fdisk/parted parsers
+# match English labels ("Disk model:", "Partition Table:") and numeric
+# fields must use '.' decimals, so localized output would silently fall
+# back to N/A everywhere
+_CMD_ENV = {**os.environ, 'LC_ALL': 'C', 'LANG': 'C'}
 
 def run_cmd(cmd):
     """Run command and return parsed JSON, or None on error."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True,
+                                env=_CMD_ENV)
         return json.loads(result.stdout)
     except Exception:
         return None
@@ -42,45 +100,75 @@ def run_cmd(cmd):
 def run_cmd_text(cmd):
     """Run command and return text output, or empty string on error."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True,
+                                env=_CMD_ENV)
         return result.stdout
     except Exception:
         return ""
 
+# Field lists requested from the LVM reporting tools; also the dict keys of
+# the parsed rows
+PVS_FIELDS = ('pv_name', 'pv_size', 'pv_free', 'vg_name', 'pv_fmt')
+VGS_FIELDS = ('vg_name', 'vg_size', 'vg_free', 'pv_count', 'lv_count',
+              'vg_attr', 'vg_extent_size')
+LVS_FIELDS = ('vg_name', 'lv_name', 'lv_size', 'seg_size_pe', 'seg_start_pe',
+              'devices')
+
+def parse_report_rows(text, keys):
+    """Parse tab-separated LVM report output into a list of row dicts.
+
+    Rows with the wrong field count (blank or malformed lines) are
+    skipped, so every returned dict carries all of keys.
+    """
+    expected = len(keys)
+    rows = []
+    for line in text.splitlines():
+        values = line.split('\t')
+        if len(values) == expected:
+            rows.append(dict(zip(keys, (v.strip() for v in values))))
+    return rows
+
+# Device-info cleanup rewrites, applied in a single scan
+_CLEAN_MAP = {
+    "HARDDISK": "HDD",
+    "(iscsi)": "",
+    "Linux device-mapper (linear) (dm)": "LINUX Dev-map",
+}
+_CLEAN_RE = re.compile('|'.join(re.escape(k) for k in _CLEAN_MAP))
+
 def clean_device_info(text):
     """Clean up device information text according to specified rules."""
-    text = text.replace("HARDDISK", "HDD")
-    text = text.replace("(iscsi)", "")
-    text = text.replace("Linux device-mapper (linear) (dm)", "LINUX Dev-map")
-    return text
-
-def load_data():
-    """Load block devices and LVM data."""
-    bs = run_cmd(['lsblk', '-b', '-O', '-J'])
-    raw_devices = bs.get('blockdevices', []) if bs else []
-    devices = []
-    seen_paths = set()  # Track unique device paths
-    
-    # Get additional disk information from fdisk and parted
+    return _CLEAN_RE.sub(lambda m: _CLEAN_MAP[m.group(0)], text)
+
+def stream_cmd(cmd, parser):
+    """Run cmd and feed its stdout to parser one line at a time.
+
+    Parsing overlaps with command execution and avoids buffering the whole
+    output as one string plus a splitlines list.
+    """
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True,
+                                env=_CMD_ENV)
+    except Exception:
+        return parser(())
+    try:
+        return parser(proc.stdout)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+def parse_fdisk(lines):
+    """Parse fdisk -l output (an iterable of lines) into a per-disk dict."""
     fdisk_info = {}
-    parted_info = {}
-    
-    # Run fdisk -l to get disk information
-    fdisk_output = run_cmd_text(['fdisk', '-l'])
-    
-    # Parse fdisk output for each disk
     current_disk = None
     disk_label_type = None
     in_partition_table = False
-    partition_info = {}
-    
-    for line in fdisk_output.splitlines():
-        line = line.strip()
-        
+    for line in lines:
         # New disk entry
         if line.startswith("Disk /"):
             # Extract device path
-            disk_path_match = re.search(r'Disk (\/[^:]+):', line)
+            disk_path_match = _DISK_RE.match(line)
             if disk_path_match:
                 current_disk = disk_path_match.group(1)
                 fdisk_info[current_disk] = {
@@ -89,23 +177,23 @@ def load_data():
                     'partitions': {}
                 }
                 in_partition_table = False
-                
+            
         # Disk model information
-        elif current_disk and "Disk model:" in line:
+        elif current_disk and line.startswith("Disk model:"):
             model = line.split("Disk model:")[1].strip()
             fdisk_info[current_disk]['disk_model'] = clean_device_info(model)
-            
+        
         # Disklabel type information
-        elif current_disk and "Disklabel type:" in line:
+        elif current_disk and line.startswith("Disklabel type:"):
             label_type = line.split("Disklabel type:")[1].strip()
             fdisk_info[current_disk]['disklabel_type'] = label_type
             disk_label_type = label_type
-            
+        
         # Start of partition table
-        elif current_disk and "Device" in line and "Start" in line and "End" in line:
+        elif current_disk and line.startswith("Device"):
             in_partition_table = True
             continue
-            
+        
         # Partition information
         elif current_disk and in_partition_table and line and not line.startswith("Disk "):
             parts = line.split()
@@ -118,19 +206,17 @@ def load_data():
                         'fdisk_type_info': ' '.join(parts[5:]) if len(parts) > 5 else 'N/A'
                     }
     
-    # Run parted -l to get additional disk information for GPT disks
-    parted_output = run_cmd_text(['parted', '-l'])
-    
-    # Parse parted output
+    return fdisk_info
+
+def parse_parted(lines):
+    """Parse parted -l output (an iterable of lines) into a per-disk dict."""
+    parted_info = {}
     current_disk = None
     in_disk_flags = False
-    
-    for line in parted_output.splitlines():
-        line = line.strip()
-        
+    for line in lines:
         # New disk entry
         if line.startswith("Disk /"):
-            disk_path_match = re.search(r'Disk (\/[^:]+):', line)
+            disk_path_match = _DISK_RE.match(line)
             if disk_path_match:
                 current_disk = disk_path_match.group(1)
                 parted_info[current_disk] = {
@@ -139,41 +225,41 @@ def load_data():
                     'partitions': {}
                 }
                 in_disk_flags = False
-                
+            
         # Model information
         elif current_disk and line.startswith("Model:"):
             model = line.split("Model:")[1].strip()
             parted_info[current_disk]['gpt_model_info'] = clean_device_info(model)
-            
+        
         # Partition table type
-        elif current_disk and "Partition Table:" in line:
+        elif current_disk and line.startswith("Partition Table:"):
             table_type = line.split("Partition Table:")[1].strip()
             parted_info[current_disk]['gpt_part_table_type'] = table_type
-            
+        
         # Start of partition table
-        elif current_disk and "Number" in line and "Start" in line and "End" in line:
+        elif current_disk and line.startswith("Number"):
             in_disk_flags = True
             continue
-            
-        # Partition information in parted output
-        elif current_disk and in_disk_flags and line and re.match(r'^\s*\d+', line):
+        
+        # Partition information in parted output (rows are indented)
+        elif current_disk and in_disk_flags and line.lstrip()[:1].isdigit():
             parts = line.split()
             if len(parts) >= 4:
                 part_num = parts[0].strip()
                 part_path = f"{current_disk}{part_num}"
-                
+            
                 # Initialize if not exists
                 if part_path not in parted_info[current_disk]['partitions']:
                     parted_info[current_disk]['partitions'][part_path] = {}
-                
+            
                 # Extract filesystem and flags
                 fs_info = parts[-2] if len(parts) > 2 else 'N/A'
                 flags_info = parts[-1] if len(parts) > 1 else 'N/A'
-                
+            
                 # Clean up the information
                 fs_info = clean_device_info(fs_info)
                 flags_info = clean_device_info(flags_info)
-                
+            
                 # Store the information
                 parted_info[current_disk]['partitions'][part_path] = {
                     'gpt_disk_flags_type': parts[4] if len(parts) > 4 else 'N/A',
@@ -181,26 +267,166 @@ def load_data():
                     'gpt_df_flagsinfo': flags_info
                 }
     
-    # Get mount point and capacity information using df command
-    df_info = {}
+    return parted_info
+
+def read_mounts_proc():
+    """Build df-style mount info from /proc/mounts and statvfs.
+
+    Reading kernel state directly avoids a fork/exec of df. Returns None
+    when /proc/mounts is unavailable so the caller can fall back to df.
+    """
     try:
-        df_output = subprocess.run(
-            ['df', '--output=source,size,used,avail,pcent,target'],
-            capture_output=True, text=True, check=True
-        ).stdout.strip()
-        
-        # Parse df output (skip header)
+        with open('/proc/mounts') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    info = {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 2 or not parts[0].startswith('/dev/'):
+            continue
+        source = parts[0]
+        mount_point = parts[1].replace('\\040', ' ')  # octal-escaped spaces
+        try:
+            st = os.statvfs(mount_point)
+        except OSError:
+            continue
+        info[source] = {
+            'mount_point': mount_point,
+            'used': format_size((st.f_blocks - st.f_bfree) * st.f_frsize),
+            'avail': format_size(st.f_bavail * st.f_frsize)
+        }
+    return info
+
+def parent_disk(path, disk_keys):
+    """Resolve the disk a device path belongs to, or None if unknown.
+
+    Linux partition naming is deterministic: strip the trailing partition
+    digits (and the 'p' separator used by nvme/mmc names) to get the disk
+    (/dev/sda3 -> /dev/sda, /dev/nvme0n1p3 -> /dev/nvme0n1).
+    """
+    if path in disk_keys:
+        return path
+    parent = path.rstrip('0123456789')
+    if parent.endswith('p') and parent[:-1] in disk_keys:
+        return parent[:-1]
+    return parent if parent in disk_keys else None
+
+def read_disk_model(name):
+    """Read a disk's model string from sysfs, or '' if not available."""
+    if not name or '/' in name:
+        return ''
+    try:
+        with open(f"/sys/block/{name}/device/model") as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+# Block device name prefixes that never carry a partition table worth
+# probing with fdisk/parted
+_VIRT_DISK_PREFIXES = ('dm-', 'loop', 'ram', 'zram', 'md')
+
+def have_physical_disks():
+    """Report whether any non-virtual whole disk exists on this host.
+
+    Containers and LVM-on-loopback hosts often have none; fdisk/parted
+    would add nothing beyond lsblk there, so the caller can skip both
+    process launches. Errs on the side of True if sysfs is unreadable.
+    """
+    try:
+        names = os.listdir('/sys/block')
+    except OSError:
+        return True
+    return any(not name.startswith(_VIRT_DISK_PREFIXES) for name in names)
+
+def load_data(use_cache=True):
+    """Load block devices and LVM data.
+
+    Results are cached on disk; when the topology key is unchanged the
+    seven-command discovery is skipped entirely.
+    """
+    key = cache_key()
+    if use_cache:
+        if _mem_cache['key'] == key:
+            return _mem_cache['data']
+        try:
+            with open(CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                data = (cached['devices'], cached['pvs_map'],
+                        cached['vg_map'], cached['lvs_map'])
+                _mem_cache['key'] = key
+                _mem_cache['data'] = data
+                return data
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # Mount info is read straight from the kernel when possible; df is only
+    # spawned as a fallback below
+    proc_mounts = read_mounts_proc()
+    # Partition-table probing is pointless without a physical disk
+    probe_disks = have_physical_disks()
+    # Fan out all external tool invocations concurrently; each is dominated
+    # by I/O and kernel probing, so wall time drops to roughly the slowest
+    # command instead of the sum of all seven
+    with concurrent.futures.ThreadPoolExecutor(max_workers=7) as pool:
+        futures = {
+            'lsblk': pool.submit(run_cmd, ['lsblk', '-b', '-O', '-J']),
+            # basic report output is a tab-separated row stream; it avoids
+            # LVM building a JSON tree and us tokenizing it back apart
+            'pvs': pool.submit(run_cmd_text, [
+                'pvs', '--reportformat', 'basic', '--separator', '\t',
+                '--noheadings', '--units', 'b', '--nosuffix',
+                '-o', ','.join(PVS_FIELDS)
+            ]),
+            'vgs': pool.submit(run_cmd_text, [
+                'vgs', '--reportformat', 'basic', '--separator', '\t',
+                '--noheadings', '--units', 'b', '--nosuffix',
+                '-o', ','.join(VGS_FIELDS)
+            ]),
+            'lvs': pool.submit(run_cmd_text, [
+                'lvs', '--reportformat', 'basic', '--separator', '\t',
+                '--noheadings', '--units', 'b', '--nosuffix',
+                '-o', ','.join(LVS_FIELDS)
+            ]),
+        }
+        if probe_disks:
+            # fdisk/parted are streamed through their parsers so parsing
+            # overlaps with the command still producing output; -s keeps
+            # parted from stalling on an interactive prompt
+            futures['fdisk'] = pool.submit(stream_cmd, ['fdisk', '-l'],
+                                           parse_fdisk)
+            futures['parted'] = pool.submit(stream_cmd, ['parted', '-s', '-l'],
+                                            parse_parted)
+        if proc_mounts is None:
+            futures['df'] = pool.submit(
+                run_cmd_text, ['df', '--output=source,size,used,avail,pcent,target'])
+
+    bs = futures['lsblk'].result()
+    raw_devices = bs.get('blockdevices', []) if bs else []
+    devices = []
+    seen_paths = set()  # Track unique device paths
+    
+    # Additional disk information, parsed in the fdisk/parted workers
+    fdisk_info = futures['fdisk'].result() if probe_disks else {}
+    parted_info = futures['parted'].result() if probe_disks else {}
+
+    # Get mount point and capacity information, preferring /proc/mounts
+    df_info = proc_mounts if proc_mounts is not None else {}
+    try:
+        df_output = futures['df'].result().strip() if proc_mounts is None else ''
+
+        # Parse df output (skip header); maxsplit leaves the mount point
+        # intact even when it contains spaces
         for line in df_output.split('\n')[1:]:
-            parts = line.split()
+            parts = line.split(None, 5)
             if len(parts) < 6:
                 continue
             
             source = parts[0]
-            size_blocks = parts[1]
             used_blocks = parts[2]
             avail_blocks = parts[3]
-            use_percent = parts[4].replace('%', '')
-            mount_point = ' '.join(parts[5:])  # Handle mount points with spaces
+            mount_point = parts[5]
             
             df_info[source] = {
                 'mount_point': mount_point,
@@ -211,7 +437,14 @@ def load_data():
         # If df command fails, continue without mount information
         pass
     
-    def dfs(dev):
+    # Hashed lookup table of known disks for O(1) parent resolution in dfs
+    disk_keys = set(fdisk_info)
+
+    # Walk the lsblk tree iteratively in pre-order; an explicit stack avoids
+    # per-frame recursion overhead and recursion-limit issues on deep trees
+    stack = list(reversed(raw_devices))
+    while stack:
+        dev = stack.pop()
         # Use path if available, otherwise use name
         path = dev.get('path') or dev.get('name', '')
         if path and path not in seen_paths:
@@ -230,11 +463,7 @@ def load_data():
             # Add additional disk information from fdisk and parted
             if path.startswith('/dev/'):
                 # Find the disk this device belongs to
-                disk_path = None
-                for disk in fdisk_info:
-                    if path == disk or path.startswith(disk):
-                        disk_path = disk
-                        break
+                disk_path = parent_disk(path, disk_keys)
                 
                 if disk_path:
                     # Add disk information
@@ -243,6 +472,10 @@ def load_data():
                         if disk_path in fdisk_info:
                             dev['disk_model'] = fdisk_info[disk_path].get('disk_model', 'N/A')
                             dev['disklabel_type'] = fdisk_info[disk_path].get('disklabel_type', 'N/A')
+                        if dev.get('disk_model', '') in ('', 'N/A'):
+                            model = read_disk_model(dev.get('name', ''))
+                            if model:
+                                dev['disk_model'] = clean_device_info(model)
                         
                         if disk_path in parted_info:
                             dev['gpt_model_info'] = parted_info[disk_path].get('gpt_model_info', 'N/A')
@@ -261,37 +494,159 @@ def load_data():
                             dev['gpt_df_flagsinfo'] = part_info.get('gpt_df_flagsinfo', 'N/A')
             
             devices.append(dev)
-        for child in dev.get('children', []):
-            dfs(child)
-            
-    for d in raw_devices:
-        dfs(d)
-    pvs_json = run_cmd([
-        'pvs', '--reportformat', 'json', '--units', 'b', '--nosuffix',
-        '-o', 'pv_name,pv_size,pv_free,vg_name,pv_fmt'
-    ])
-    vgs_json = run_cmd([
-        'vgs', '--reportformat', 'json', '--units', 'b', '--nosuffix',
-        '-o', 'vg_name,vg_size,vg_free,pv_count,lv_count,vg_attr,vg_extent_size'
-    ])
-    lvs_json = run_cmd([
-        'lvs', '--reportformat', 'json', '--units', 'b', '--nosuffix',
-        '-o', 'vg_name,lv_name,lv_size,seg_size_pe,seg_start_pe,devices'
-    ])
-
-    pvs = pvs_json.get('report', [{}])[0].get('pv', []) if pvs_json else []
-    vgs = vgs_json.get('report', [{}])[0].get('vg', []) if vgs_json else []
-    lvs = lvs_json.get('report', [{}])[0].get('lv', []) if lvs_json else []
-
-    pvs_map = {pv.get('pv_name'): pv for pv in pvs}
-    vg_map = {vg.get('vg_name'): vg for vg in vgs}
+        children = dev.get('children', [])
+        if children:
+            stack.extend(reversed(children))
+    # Build the lookup maps straight from the parsed rows; every row is
+    # guaranteed complete, so index the key fields directly
+    pvs_map = {pv['pv_name']: pv
+               for pv in parse_report_rows(futures['pvs'].result(), PVS_FIELDS)}
+    vg_map = {vg['vg_name']: vg
+              for vg in parse_report_rows(futures['vgs'].result(), VGS_FIELDS)}
     lvs_map = {}
-    for lv in lvs:
-        vg_name = lv.get('vg_name')
-        lvs_map.setdefault(vg_name, []).append(lv)
+    for lv in parse_report_rows(futures['lvs'].result(), LVS_FIELDS):
+        lvs_map.setdefault(lv['vg_name'], []).append(lv)
+
+    if use_cache:
+        _mem_cache['key'] = key
+        _mem_cache['data'] = (devices, pvs_map, vg_map, lvs_map)
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            with open(CACHE_PATH, 'w') as f:
+                json.dump({'key': key, 'devices': devices, 'pvs_map': pvs_map,
+                           'vg_map': vg_map, 'lvs_map': lvs_map}, f)
+        except (OSError, TypeError):
+            pass
 
     return devices, pvs_map, vg_map, lvs_map
 
+def _to_int(s):
+    """Convert an LVM numeric string (possibly "123.00") straight to int.
+
+    Avoids the int(float(...)) two-step and its transient float object.
+    Raises ValueError/TypeError on non-numeric input like the old path.
+    """
+    if isinstance(s, str):
+        i = s.find('.')
+        return int(s) if i < 0 else int(s[:i])
+    return int(s)
+
+
+def _render_lv_row(win, y, lv, vg_pe_size_int, vg_width, h):
+    """Render one logical volume table row at line y, returning the next y.
+
+    Shared by both LV listing passes in draw_ui so the hot per-row
+    parsing and formatting runs through a single code object.
+    """
+    if not 0 <= y < h:
+        # Off-screen row: skip the parsing and formatting outright
+        return y + 1
+
+    # The rendered row depends only on the LV's own fields plus the VG PE
+    # size and the panel width, none of which change between keystrokes;
+    # cache it on the lv dict so repeat frames skip the segment parsing
+    # and formatting entirely
+    cached = lv.get('_row_cache')
+    if cached is not None and cached[0] == (vg_pe_size_int, vg_width):
+        try:
+            win.addnstr(y, 4, cached[1], vg_width - 6)
+        except curses.error:
+            pass
+        return y + 1
+
+    # Calculate PE count and PE size
+    pe_count = _NA
+    pe_size = _NA
+
+    # Parse the segment size in PEs once; it is reused below
+    # for the PE size and LE end calculations.
+    try:
+        seg_size_pe_int = _to_int(lv.get('seg_size_pe') or '')
+    except (ValueError, TypeError):
+        seg_size_pe_int = None
+    if seg_size_pe_int is not None:
+        pe_count = seg_size_pe_int
+        # Calculate PE size using VG PE size
+        if vg_pe_size_int is not None:
+            pe_size = format_size(vg_pe_size_int * seg_size_pe_int)
+
+    pvlist = lv.get('devices', '')
+
+    # Get LE start and end values
+    le_start = _NA
+    le_end = _NA
+
+    # First try to get LE start directly from LV metadata
+    seg_start_pe = lv.get('seg_start_pe')
+    if seg_start_pe and seg_start_pe != "":
+        try:
+            start_le = _to_int(seg_start_pe)
+            le_start = str(start_le)
+
+            # Calculate LE end based on LE start and size
+            if seg_size_pe_int is not None:
+                le_end = str(start_le + seg_size_pe_int - 1)
+        except (ValueError, TypeError):
+            pass
+
+    # Truncate pvlist if too long to prevent boundary errors
+    max_width = vg_width - 40  # Reserve space for other columns
+    if len(pvlist) > max_width:
+        pvlist = pvlist[:max_width-3] + "..."
+
+    # Walk the PV segments once: split each "name(pe)" pair with a single
+    # precompiled match, building the clean device list and PE start info
+    # together.  The first PE value doubles as the LE-start fallback when
+    # the LV metadata lacked seg_start_pe.
+    clean_parts = []
+    pe_parts = []
+
+    for pv_segment in pvlist.split(','):
+        m = _PV_SEG_RE.match(pv_segment)
+        if m:
+            name, pe_val = m.group(1), m.group(2)
+            pe_parts.append(pe_val)
+            # Clean device name without the "(pe)" suffix
+            clean_parts.append(name)
+
+            if le_start is _NA:
+                le_start = pe_val
+                if seg_size_pe_int is not None:
+                    le_end = str(int(pe_val) + seg_size_pe_int - 1)
+        else:
+            # No "(pe)" suffix found, use as is
+            clean_parts.append(pv_segment.strip())
+
+    clean_pvlist = ", ".join(clean_parts)
+    pe_start_info = ", ".join(pe_parts)
+
+    # Pre-truncate the trailing column to what can still be visible after
+    # the 65 columns of fixed-width fields; formatting bytes that addnstr
+    # would clip anyway is wasted work on narrow terminals
+    pe_budget = vg_width - 71
+    if len(pe_start_info) > pe_budget:
+        pe_start_info = pe_start_info[:max(0, pe_budget)]
+
+    # Truncate if too long
+    max_dev_width = vg_width - 60  # Reserve space for other columns
+    if len(clean_pvlist) > max_dev_width:
+        clean_pvlist = clean_pvlist[:max_dev_width-3] + "..."
+
+    # Assemble the row with ljust/rjust + join: identical layout to
+    # _ROW_FMT but without per-call format-spec parsing
+    formatted_str = " ".join((
+        le_start.ljust(10), le_end.ljust(10), str(pe_count).rjust(10),
+        pe_size.rjust(10), clean_pvlist.ljust(20), pe_start_info))
+    lv['_row_cache'] = ((vg_pe_size_int, vg_width), formatted_str)
+    try:
+        # addnstr clips to the window width in C; no Python-level
+        # len() check and slice needed
+        win.addnstr(y, 4, formatted_str, vg_width - 6)
+    except curses.error:
+        pass
+    return y + 1
+
+
 def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
     """Draw the curses UI with LVM information."""
     # Initialize curses settings
@@ -299,7 +654,156 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
     curses.start_color()
     curses.use_default_colors()
     curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Selected item highlight
+    # The cursor is hidden and never meaningful in this UI; leaveok lets
+    # curses skip the cursor-repositioning escape codes on every refresh
+    stdscr.leaveok(True)
+
+    # Cache the exception type once; it is consulted on every write below
+    _err = curses.error
+
+    h = w = 0
+
+    # Truncated display strings, cached per (string, width); cleared when
+    # the terminal is resized since the widths change
+    display_cache = {}
+
+    def trunc(text, maxlen, suffix='...'):
+        """Truncate text to maxlen with a suffix, memoizing the result."""
+        key = (text, maxlen, suffix)
+        result = display_cache.get(key)
+        if result is None:
+            result = text if len(text) <= maxlen else text[:maxlen - len(suffix)] + suffix
+            display_cache[key] = result
+        return result
+
+    def put(win, y, x, text, attr=0):
+        """Write a string to win, skipping rows outside the visible area."""
+        if not 0 <= y < h:
+            return
+        try:
+            win.addstr(y, x, text, attr)
+        except _err:
+            pass
+
+    # Normalize devices to dicts once so the loops below can use plain
+    # .get access instead of an isinstance branch per row. The filler
+    # fields reproduce what the old non-dict fallbacks displayed.
+    devices = [d if isinstance(d, dict) else
+               {'path': d, 'name': str(d), 'size': None, 'type': 'Unknown',
+                'fdisk_type_info': 'N/A', 'gpt_fs_info': 'N/A',
+                'gpt_df_flagsinfo': 'N/A'}
+               for d in devices]
+
+    # Index devices by path once; LV rows resolve mount info via O(1) lookup
+    devices_by_path = {d.get('path'): d for d in devices if d.get('path')}
+    device_at = devices_by_path.get
+
+    def block_dev_row(dev):
+        """Format one block device table row; static per draw_ui call."""
+        name = dev.get('name', 'Unknown')
+        size = format_size(dev.get('size', 0))
+        dev_type = dev.get('type', 'Unknown')
+
+        # Get additional info from fdisk/parted with priority to parted
+        # Only use fdisk_type_info for Disk column, not fdisk_id_info
+        disk_type = dev.get('fdisk_type_info', '---')
+        fs_info = dev.get('gpt_fs_info', '---')
+        flags_info = dev.get('gpt_df_flagsinfo', '---')
+
+        # Determine partition type for Part column
+        part_type = '---'
+
+        # Get device type and partition type info from various sources,
+        # lowercased once for the classification below
+        dev_type_value = dev.get('type', '')
+        fdisk_id = dev.get('fdisk_id_info', '').lower()
+        gpt_flags = dev.get('gpt_disk_flags_type', '').lower()
+
+        # If it's a disk, display "Disk" in the Part column
+        if dev_type_value == 'disk':
+            part_type = 'Disk'
+        # Check for partition type and set appropriate value
+        elif dev_type_value == 'part':
+            if 'primary' in fdisk_id or 'primary' in gpt_flags:
+                part_type = 'Pri'
+            elif 'extended' in fdisk_id or 'extended' in gpt_flags:
+                part_type = 'Extd'
+            elif 'logical' in fdisk_id or 'logical' in gpt_flags:
+                part_type = 'Logi'
+            else:
+                # Default to 'Pri' for regular partitions if type not detected
+                part_type = 'Pri'
+
+        # Set Flags to '---' if Unit='part' and Part='Extd', per latest feedback
+        if dev_type_value == 'part' and part_type == 'Extd':
+            flags_info = '---'
 
+        part_table_type = dev.get('gpt_part_table_type', 'N/A')
+        if part_table_type != 'N/A':
+            disk_type = part_table_type
+
+        # Truncate name if too long
+        name = trunc(name, 13)
+
+        # Truncate other fields if too long
+        part_type = _clip6(part_type)
+        disk_type = _clip6(disk_type)
+        fs_info = _clip6(fs_info)
+        flags_info = _clip6(flags_info)
+        dev_type = _clip6(dev_type)
+
+        # Uppercase 'lvm' in Flags column if present
+        if flags_info == 'lvm':
+            flags_info = 'LVM'
+
+        # ljust + join pads each cell with direct C string calls, with no
+        # format mini-language at all
+        return " ".join((name.ljust(15), size.ljust(12), dev_type.ljust(8),
+                         part_type.ljust(8), disk_type.ljust(8),
+                         fs_info.ljust(8), flags_info.ljust(8)))
+
+    # PV backing each device, resolved once per refresh; the key handler
+    # and both panels re-query this for the selected device per keypress
+    dev_to_pv = [pvs_map.get(d.get('path')) for d in devices]
+
+    # PVs grouped by VG once per refresh; the PV panel and the panel-1
+    # key handler otherwise re-filter the whole pvs_map every keypress
+    pvs_by_vg = {}
+    for p in pvs_map.values():
+        pvs_by_vg.setdefault(p.get('vg_name'), []).append(p)
+
+    # The row text is identical on every frame; only the highlight
+    # attribute tracks the selection. Format all rows once per refresh.
+    block_rows = [block_dev_row(d) for d in devices]
+
+    # Group each VG's logical volumes by name once; the grouping cannot
+    # change between keystrokes, so rebuilding it per frame is wasted work
+    lv_groups_map = {}
+    for vg, lvs in lvs_map.items():
+        groups = {}
+        for lv in lvs:
+            groups.setdefault(lv.get('lv_name'), []).append(lv)
+        lv_groups_map[vg] = groups
+
+    # LV count per PV, by VG, also computed once per refresh: the head of
+    # each device segment before "(" is the clean PV name; count exact
+    # matches against the known PV names. The PV panel previously redid
+    # this per keystroke.
+    pv_name_set = set(pvs_map)
+    pv_lv_count_map = {}
+    for vg, lvs in lvs_map.items():
+        counter = collections.Counter()
+        for lv in lvs:
+            # Counter.update runs the counting loop in C and defaults
+            # missing names to 0
+            counter.update(
+                name for name in
+                (seg.partition('(')[0].strip()
+                 for seg in lv.get('devices', '').split(','))
+                if name in pv_name_set)
+        pv_lv_count_map[vg] = counter
+
+    last_hw = None  # Terminal geometry for which the panels were created
     current = 0  # Current selected device index
     block_dev_selected = 0  # Current selected block device index
     pv_selected = 0  # Current selected physical volume index
@@ -308,7 +812,7 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
     # Main UI loop
     while True:
         try:
-            stdscr.clear()
+            stdscr.erase()
             h, w = stdscr.getmaxyx()
             
             # Ensure minimum window size
@@ -334,234 +838,120 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
             # Create Volume Group panel (left side, full height)
             #------------------------------------------------------------
             
-            right = stdscr.derwin(h, vg_width, 0, 0)
+            # (Re)create the three panels only when the terminal geometry
+            # changes; reallocating subwindows every keypress is wasted work
+            if (h, w) != last_hw:
+                right = stdscr.derwin(h, vg_width, 0, 0)
+                pv_panel = stdscr.derwin(pv_height, pv_width, 0, vg_width)
+                block_dev_panel = stdscr.derwin(block_dev_height, pv_width, pv_height, vg_width)
+                right.leaveok(True)
+                pv_panel.leaveok(True)
+                block_dev_panel.leaveok(True)
+                display_cache.clear()
+                # Clip the cached block device rows to the new panel width
+                # here, once per resize, so the frame loop writes them with
+                # no per-row length handling at all
+                block_rows_clipped = [r[:max(0, pv_width - 4)]
+                                      for r in block_rows]
+                last_hw = (h, w)
             right.box()
             dev = devices[current] if devices else {}
             
             # Flag to track if we've already displayed information
             info_displayed = False
             
-            if isinstance(dev, dict):
-                path = dev.get('path')
-                # Check if the selected device is a logical volume
-                if dev.get('type') == 'lvm':
-                    # Display LV information directly
-                    try:
-                        right.addstr(0, 2, f" Logical Volume Information ")
-                    except curses.error:
-                        pass
-                    
-                    # Extract VG and LV names from path
-                    # Handle both path formats: /dev/VGName/LVName and /dev/mapper/VGName-LVName
-                    vg_name = None
-                    lv_name = None
-                    
-                    if '/dev/mapper/' in path:
-                        # Format: /dev/mapper/VGName-LVName
-                        parts = path.replace('/dev/mapper/', '').split('-')
-                        if len(parts) >= 2:
-                            vg_name = parts[0]
-                            lv_name = '-'.join(parts[1:])  # Handle LV names with hyphens
-                    elif '/dev/' in path:
-                        # Format: /dev/VGName/LVName
-                        parts = path.replace('/dev/', '').split('/')
-                        if len(parts) >= 2:
-                            vg_name = parts[0]
-                            lv_name = '/'.join(parts[1:])  # Handle LV names with slashes
-                    
-                    # Display basic information
-                    try:
-                        right.addstr(2, 2, f"Device: {path}")
-                        right.addstr(3, 2, f"VG Name: {vg_name if vg_name else 'Unknown'}")
-                        right.addstr(4, 2, f"LV Name: {lv_name if lv_name else 'Unknown'}")
-                        right.addstr(5, 2, f"Size: {format_size(dev.get('size', 'N/A'))}")
-                    except curses.error:
-                        # Skip if we can't write the information
-                        pass
-                    
-                    # Display mount point information
-                    mount_point = dev.get('mount_point', 'N/A')
-                    used = dev.get('used', 'N/A')
-                    available = dev.get('avail', 'N/A')
-                    
-                    try:
-                        right.addstr(7, 2, f"Mounted: {mount_point}")
-                        right.addstr(8, 2, f"Used: {used}")
-                        right.addstr(9, 2, f"Available: {available}")
-                    except curses.error:
-                        # Skip if we can't write the information
-                        pass
-                    
-                    # Mark that we've displayed information
-                    info_displayed = True
-            
+            path = dev.get('path')
+            # Check if the selected device is a logical volume
+            if dev.get('type') == 'lvm':
+                # Display LV information directly
+                put(right, 0, 2, f" Logical Volume Information ")
+                
+                # Extract VG and LV names from path
+                # Handle both path formats: /dev/VGName/LVName and /dev/mapper/VGName-LVName
+                vg_name = None
+                lv_name = None
+                
+                if '/dev/mapper/' in path:
+                    # Format: /dev/mapper/VGName-LVName
+                    parts = path.replace('/dev/mapper/', '').split('-')
+                    if len(parts) >= 2:
+                        vg_name = parts[0]
+                        lv_name = '-'.join(parts[1:])  # Handle LV names with hyphens
+                elif '/dev/' in path:
+                    # Format: /dev/VGName/LVName
+                    parts = path.replace('/dev/', '').split('/')
+                    if len(parts) >= 2:
+                        vg_name = parts[0]
+                        lv_name = '/'.join(parts[1:])  # Handle LV names with slashes
+                
+                # Display basic information
+                put(right, 2, 2, f"Device: {path}")
+                put(right, 3, 2, f"VG Name: {vg_name if vg_name else 'Unknown'}")
+                put(right, 4, 2, f"LV Name: {lv_name if lv_name else 'Unknown'}")
+                put(right, 5, 2, f"Size: {format_size(dev.get('size', 'N/A'))}")
+                
+                # Display mount point information
+                mount_point = dev.get('mount_point', 'N/A')
+                used = dev.get('used', 'N/A')
+                available = dev.get('avail', 'N/A')
+                
+                put(right, 7, 2, f"Mounted: {mount_point}")
+                put(right, 8, 2, f"Used: {used}")
+                put(right, 9, 2, f"Available: {available}")
+                
+                # Mark that we've displayed information
+                info_displayed = True
+        
             # Only proceed with PV/VG display if we haven't already displayed LV info
             if not info_displayed:
-                if isinstance(dev, dict):
-                    path = dev.get('path')
-                else:
-                    path = dev
-                    
-                pv = pvs_map.get(path)
+                path = dev.get('path')
+                pv = dev_to_pv[current] if devices else None
                 if pv:
                     vg_name = pv.get('vg_name')
                     vg = vg_map.get(vg_name, {})
                     vg_size = format_size(vg.get('vg_size'))
-                    # Truncate vg_name if too long
-                    display_vg_name = vg_name
-                    if vg_name and len(vg_name) > vg_width - 15:
-                        display_vg_name = vg_name[:vg_width - 18] + "..."
-                    try:
-                        header_text = f" Volume Group - {display_vg_name} ({vg_size}) "
-                        # Make sure the header isn't too long
-                        if len(header_text) > vg_width - 4:
-                            header_text = header_text[:vg_width - 7] + "... "
-                        right.addstr(0, 2, header_text)
-                    except curses.error:
-                        # Skip if we can't write the header
-                        pass
+                    # Truncate vg_name and header if too long
+                    display_vg_name = trunc(vg_name, vg_width - 15) if vg_name else vg_name
+                    header_text = trunc(f" Volume Group - {display_vg_name} ({vg_size}) ",
+                                        vg_width - 4, "... ")
+                    put(right, 0, 2, header_text)
                     
                     vg_free_formatted = format_size(vg.get('vg_free')) if vg.get('vg_free') else 'N/A'
                     
                     fmt = vg.get('vg_attr', '')
                     lvs_in_vg = lvs_map.get(vg_name, [])
-                    lv_names = [lv.get('lv_name') for lv in lvs_in_vg]
-                    lv_names_set = set(lv_names)
-                    # Remove duplicates while preserving order
+                    # Remove duplicate names while preserving order, in one pass
+                    lv_names = list(dict.fromkeys(lv.get('lv_name') for lv in lvs_in_vg))
                     
                     # Truncate lv_names if joined string is too long
-                    lv_names_str = ', '.join(lv_names_set) if lv_names_set else 'none'
-                    if len(lv_names_str) > vg_width - 20:
-                        lv_names_str = lv_names_str[:vg_width - 23] + "..."
+                    lv_names_str = trunc(', '.join(lv_names), vg_width - 20) if lv_names else 'none'
                         
                     # Get PE Size information
                     vg_pe_size = vg.get('vg_extent_size', 'N/A')
                     vg_pe_size_formatted = format_size(vg_pe_size) if vg_pe_size != 'N/A' else 'N/A'
-                    
-                    try:
-                        right.addstr(2, 2, f"VG Format:     {fmt}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    try:
-                        right.addstr(3, 2, f"VG seg size: {vg_pe_size_formatted}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    try:
-                        right.addstr(4, 2, f"Logical Vols:  {lv_names_str}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    try:
-                        right.addstr(5, 2, f"Free space:   {vg_free_formatted}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    
-                    # Only add header if we have vertical space
-                    if h > 7:
-                        try:
-                            right.addstr(7, 2, "[ Discovered LVols.. ]", curses.A_BOLD)
-                        except curses.error:
-                            pass
-                    y = 9
-                    # Group Logical Volumes by name
-                    lv_groups = {}
-                    for lv in lvs_in_vg:
-                        name = lv.get('lv_name')
-                        lv_groups.setdefault(name, []).append(lv)
-                    for name, group in lv_groups.items():
-                        if y >= h - 2:  # Check against right window height instead of full screen
-                            break
-                        # Truncate name if too long to prevent boundary errors
-                        display_name = name[:vg_width-20] + '...' if len(name) > vg_width-17 else name
-                        try:
-                            lv_text = f"Logical Volume: {display_name}"
-                            # Check if the text would fit in the window
-                            if len(lv_text) > vg_width - 4:
-                                lv_text = lv_text[:vg_width - 7] + "..."
-                            right.addstr(y, 2, lv_text, curses.A_BOLD)
-                        except curses.error:
-                            # Skip if we can't write this line
-                            pass
-                        y += 1
-                # We need to ensure the PV display still works correctly
-                # This section was removed because it duplicated code, but we need to make sure
-                # the Volume Group information is still displayed properly when a PV is selected
-                if pv:
-                    vg_name = pv.get('vg_name')
-                    vg = vg_map.get(vg_name, {})
-                    vg_size = format_size(vg.get('vg_size'))
-                    # Truncate vg_name if too long
-                    display_vg_name = vg_name
-                    if vg_name and len(vg_name) > vg_width - 15:
-                        display_vg_name = vg_name[:vg_width - 18] + "..."
                     try:
-                        header_text = f" Volume Group - {display_vg_name} ({vg_size}) "
-                        # Make sure the header isn't too long
-                        if len(header_text) > vg_width - 4:
-                            header_text = header_text[:vg_width - 7] + "... "
-                        right.addstr(0, 2, header_text)
-                    except curses.error:
-                        # Skip if we can't write the header
-                        pass
-                    
-                    vg_free_formatted = format_size(vg.get('vg_free')) if vg.get('vg_free') else 'N/A'
+                        vg_pe_size_int = _to_int(vg_pe_size) if vg_pe_size != 'N/A' else None
+                    except (ValueError, TypeError):
+                        vg_pe_size_int = None
                     
-                    fmt = vg.get('vg_attr', '')
-                    lvs_in_vg = lvs_map.get(vg_name, [])
-                    lv_names = [lv.get('lv_name') for lv in lvs_in_vg]
-                    lv_names_set = set(lv_names)
-                    
-                    # Truncate lv_names if joined string is too long
-                    lv_names_str = ', '.join(lv_names_set) if lv_names_set else 'none'
-                    if len(lv_names_str) > vg_width - 20:
-                        lv_names_str = lv_names_str[:vg_width - 23] + "..."
-                        
-                    # Get PE Size information
-                    vg_pe_size = vg.get('vg_extent_size', 'N/A')
-                    vg_pe_size_formatted = format_size(vg_pe_size) if vg_pe_size != 'N/A' else 'N/A'
-                    
-                    try:
-                        right.addstr(2, 2, f"VG Format:     {fmt}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    try:
-                        right.addstr(3, 2, f"VG seg size: {vg_pe_size_formatted}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    try:
-                        right.addstr(4, 2, f"Logical Vols:  {lv_names_str}"[:vg_width - 4])
-                    except curses.error:
-                        pass
-                    try:
-                        right.addstr(5, 2, f"Free space:   {vg_free_formatted}"[:vg_width - 4])
-                    except curses.error:
-                        pass
+                    put(right, 2, 2, f"VG Format:     {fmt}"[:vg_width - 4])
+                    put(right, 3, 2, f"VG seg size: {vg_pe_size_formatted}"[:vg_width - 4])
+                    put(right, 4, 2, f"Logical Vols:  {lv_names_str}"[:vg_width - 4])
+                    put(right, 5, 2, f"Free space:   {vg_free_formatted}"[:vg_width - 4])
                     
                     # Only add header if we have vertical space
                     if h > 7:
-                        try:
-                            right.addstr(7, 2, "[ Discovered LVols.. ]", curses.A_BOLD)
-                        except curses.error:
-                            pass
+                        put(right, 7, 2, "[ Discovered LVols.. ]", curses.A_BOLD)
                     y = 9
-                    # Group Logical Volumes by name
-                    lv_groups = {}
-                    for lv in lvs_in_vg:
-                        name = lv.get('lv_name')
-                        lv_groups.setdefault(name, []).append(lv)
+                    # Logical Volumes grouped by name, precomputed above
+                    lv_groups = lv_groups_map.get(vg_name, {})
                     for name, group in lv_groups.items():
                         if y >= h - 2:  # Check against right window height instead of full screen
                             break
                         # Truncate name if too long to prevent boundary errors
-                        display_name = name[:vg_width-20] + '...' if len(name) > vg_width-17 else name
-                        try:
-                            lv_text = f"Logical Volume: {display_name}"
-                            # Check if the text would fit in the window
-                            if len(lv_text) > vg_width - 4:
-                                lv_text = lv_text[:vg_width - 7] + "..."
-                            right.addstr(y, 2, lv_text, curses.A_BOLD)
-                        except curses.error:
-                            # Skip if we can't write this line
-                            pass
+                        display_name = trunc(name, vg_width - 17)
+                        lv_text = trunc(f"Logical Volume: {display_name}", vg_width - 4)
+                        put(right, y, 2, lv_text, curses.A_BOLD)
                         y += 1
                         
                         # Add mount point and capacity information
@@ -576,48 +966,26 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                         used = "N/A"
                         available = "N/A"
                         
-                        # Search for mount point and capacity information in devices
-                        # Check both possible path formats with flexible matching
-                        for dev in devices:
-                            if isinstance(dev, dict) and dev.get('path'):
-                                dev_path = dev.get('path')
-                                
-                                # Check for exact match or if the path contains the LV identifiers
-                                if (dev_path == lv_path_dev or
-                                    dev_path == lv_path_mapper or
-                                    f"/dev/{vg_name}/{name}" in dev_path or
-                                    f"/dev/mapper/{vg_name}-{name}" in dev_path or
-                                    f"/{vg_name}/{name}" in dev_path or
-                                    f"/{vg_name}-{name}" in dev_path):
-                                    mount_point = dev.get('mount_point', 'N/A')
-                                    used = dev.get('used', 'N/A')
-                                    available = dev.get('avail', 'N/A')
-                                    break
+                        # Look up mount point and capacity information by device path
+                        dev_match = (device_at(lv_path_dev) or
+                                     device_at(lv_path_mapper))
+                        if dev_match:
+                            mount_point = dev_match.get('mount_point', 'N/A')
+                            used = dev_match.get('used', 'N/A')
+                            available = dev_match.get('avail', 'N/A')
                         
                         # Display additional information
-                        try:
-                            right.addstr(y, 4, f"Mounted: {mount_point}"[:vg_width - 6])
-                            y += 1
-                        except curses.error:
-                            pass
+                        put(right, y, 4, f"Mounted: {mount_point}"[:vg_width - 6])
+                        y += 1
                         
-                        try:
-                            right.addstr(y, 4, f"Capacity: {capacity}"[:vg_width - 6])
-                            y += 1
-                        except curses.error:
-                            pass
+                        put(right, y, 4, f"Capacity: {capacity}"[:vg_width - 6])
+                        y += 1
                         
-                        try:
-                            right.addstr(y, 4, f"Used: {used}"[:vg_width - 6])
-                            y += 1
-                        except curses.error:
-                            pass
+                        put(right, y, 4, f"Used: {used}"[:vg_width - 6])
+                        y += 1
                         
-                        try:
-                            right.addstr(y, 4, f"Available: {available}"[:vg_width - 6])
-                            y += 1
-                        except curses.error:
-                            pass
+                        put(right, y, 4, f"Available: {available}"[:vg_width - 6])
+                        y += 1
                         
                         # Add blank line before tabular data
                         y += 1
@@ -625,198 +993,34 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                         # Ensure we don't write outside window boundaries
                         if y >= h - 2:
                             break
-                        try:
-                            formatted_header = "{:<10} {:<10} {:>10} {:>10} {:<20} {}".format(
-                                "LE Start", "LE End", "PE Count", "PE Size", "PVs", "PE Start")
-                            # Ensure we don't write beyond window width
-                            max_line_width = vg_width - 6  # Allow for borders and margin
-                            if len(formatted_header) > max_line_width:
-                                formatted_header = formatted_header[:max_line_width]
-                            right.addstr(y, 4, formatted_header, curses.A_UNDERLINE)
-                        except curses.error:
-                            # Skip if we can't write the header (probably out of bounds)
-                            pass
+                        formatted_header = _ROW_FMT(
+                            "LE Start", "LE End", "PE Count", "PE Size", "PVs", "PE Start")
+                        # Ensure we don't write beyond window width
+                        max_line_width = vg_width - 6  # Allow for borders and margin
+                        if len(formatted_header) > max_line_width:
+                            formatted_header = formatted_header[:max_line_width]
+                        put(right, y, 4, formatted_header, curses.A_UNDERLINE)
                         y += 1
-                        for lv in group:
-                            if y >= h - 2:  # Check against full screen height
-                                break
-                            
-                            # Calculate PE count and PE size
-                            pe_count = "N/A"
-                            pe_size = "N/A"
-                            
-                            # Get segment size in PEs
-                            seg_size_pe = lv.get('seg_size_pe', '0')
-                            if seg_size_pe and seg_size_pe != "":
-                                try:
-                                    pe_count = int(float(seg_size_pe))
-                                    
-                                    # Calculate PE size using VG PE size
-                                    if vg_pe_size != 'N/A':
-                                        try:
-                                            pe_size_bytes = int(float(vg_pe_size)) * pe_count
-                                            pe_size = format_size(pe_size_bytes)
-                                        except (ValueError, TypeError):
-                                            pe_size = "N/A"
-                                except (ValueError, TypeError):
-                                    pe_count = "N/A"
-                            
-                            pvlist = lv.get('devices', '')
-                            
-                            # Get LE start and end values
-                            le_start = "N/A"
-                            le_end = "N/A"
-                            
-                            # First try to get LE start directly from LV metadata
-                            seg_start_pe = lv.get('seg_start_pe')
-                            if seg_start_pe and seg_start_pe != "":
-                                try:
-                                    start_le = int(float(seg_start_pe))
-                                    le_start = str(start_le)
-                                    
-                                    # Calculate LE end based on LE start and size
-                                    seg_size_pe = lv.get('seg_size_pe', '0')
-                                    if seg_size_pe and seg_size_pe != "":
-                                        try:
-                                            le_count = int(float(seg_size_pe))
-                                            le_end = str(start_le + le_count - 1)
-                                        except (ValueError, TypeError):
-                                            le_end = "N/A"
-                                except (ValueError, TypeError):
-                                    pass
-                            
-                            # Fallback: Parse from device string if direct metadata not available
-                            if le_start == "N/A" and pvlist:
-                                # Parse LE start from device string, format is like "/dev/sda1(123)"
-                                # where 123 is the LE start
-                                for pv_segment in pvlist.split(','):
-                                    pv_segment = pv_segment.strip()
-                                    # Extract LE start from segment
-                                    start_pos = pv_segment.find('(')
-                                    end_pos = pv_segment.find(')')
-                                    if start_pos > 0 and end_pos > start_pos:
-                                        le_start = pv_segment[start_pos+1:end_pos]
-                                        # Calculate LE end based on LE start and size
-                                        try:
-                                            start_le = int(float(le_start))
-                                            # Get segment size in LEs
-                                            seg_size_pe = lv.get('seg_size_pe', '0')
-                                            if seg_size_pe and seg_size_pe != "":
-                                                try:
-                                                    le_count = int(float(seg_size_pe))
-                                                    le_end = str(start_le + le_count - 1)
-                                                except (ValueError, TypeError):
-                                                    le_end = "N/A"
-                                        except (ValueError, TypeError):
-                                            le_end = "N/A"
-                                        break
-                            
-                            # Ensure we don't write outside window boundaries
-                            if y >= h - 2:
-                                break
-                                
-                            # Truncate pvlist if too long to prevent boundary errors
-                            max_width = vg_width - 40  # Reserve space for other columns
-                            if len(pvlist) > max_width:
-                                pvlist = pvlist[:max_width-3] + "..."
-                                
-                            # Extract PE start info and clean device names
-                            clean_pvlist = ""
-                            pe_start_info = ""
-                            
-                            for pv_segment in pvlist.split(','):
-                                pv_segment = pv_segment.strip()
-                                # Extract PE start from segment
-                                start_pos = pv_segment.find('(')
-                                end_pos = pv_segment.find(')')
-                                
-                                if start_pos > 0 and end_pos > start_pos:
-                                    # Extract the PE start value
-                                    pe_val = pv_segment[start_pos+1:end_pos]
-                                    # Add to PE start info
-                                    if pe_start_info:
-                                        pe_start_info += ", "
-                                    pe_start_info += pe_val
-                                    
-                                    # Add clean device name without parentheses
-                                    if clean_pvlist:
-                                        clean_pvlist += ", "
-                                    clean_pvlist += pv_segment[:start_pos]
-                                else:
-                                    # No parentheses found, use as is
-                                    if clean_pvlist:
-                                        clean_pvlist += ", "
-                                    clean_pvlist += pv_segment
-                            
-                            # Truncate if too long
-                            max_dev_width = vg_width - 60  # Reserve space for other columns
-                            if len(clean_pvlist) > max_dev_width:
-                                clean_pvlist = clean_pvlist[:max_dev_width-3] + "..."
-                            
-                            # Format string with boundary check
-                            try:
-                                formatted_str = "{:<10} {:<10} {:>10} {:>10} {:<20} {}".format(
-                                    le_start, le_end, str(pe_count), pe_size, clean_pvlist, pe_start_info)
-                                # Ensure we don't write beyond window width
-                                max_line_width = vg_width - 6  # Allow for borders and margin
-                                if len(formatted_str) > max_line_width:
-                                    formatted_str = formatted_str[:max_line_width]
-                                right.addstr(y, 4, formatted_str)
-                            except curses.error:
-                                # Skip this line if we can't write it (probably out of bounds)
-                                pass
-                            y += 1
+                        # Clip to the rows that fit before looping
+                        for lv in group[:max(0, h - 2 - y)]:
+                            y = _render_lv_row(right, y, lv, vg_pe_size_int,
+                                               vg_width, h)
                         y += 1
                     else:
-                        try:
-                            right.addstr(1, 2, f"No LVM info for {path}")
-                        except curses.error:
-                            # Skip if we can't write the message
-                            pass
+                        put(right, 1, 2, f"No LVM info for {path}")
                     
-                    # Add mount point and capacity information
-                    # Find the device path for this logical volume
-                    # LVM volumes can be accessed via two path formats:
-                    # 1. /dev/VGName/LVName
-                    # 2. /dev/mapper/VGName-LVName (with hyphen instead of slash)
-                    lv_path_dev = f"/dev/{vg_name}/{name}"
-                    lv_path_mapper = f"/dev/mapper/{vg_name}-{name}"
-                    mount_point = "N/A"
-                    capacity = format_size(group[0].get('lv_size')) if group else "N/A"
-                    used = "N/A"
-                    available = "N/A"
-                    
-                    # Search for mount point and capacity information in devices
-                    # Check both possible path formats with flexible matching
-                    for dev in devices:
-                        if isinstance(dev, dict) and dev.get('path'):
-                            dev_path = dev.get('path')
-                            
-                            # Check for exact match or if the path contains the LV identifiers
-                            if (dev_path == lv_path_dev or
-                                dev_path == lv_path_mapper or
-                                f"/dev/{vg_name}/{name}" in dev_path or
-                                f"/dev/mapper/{vg_name}-{name}" in dev_path or
-                                f"/{vg_name}/{name}" in dev_path or
-                                f"/{vg_name}-{name}" in dev_path):
-                                mount_point = dev.get('mount_point', 'N/A')
-                                used = dev.get('used', 'N/A')
-                                available = dev.get('avail', 'N/A')
-                                break
-                    
-                    # Display additional information
-                    try:
-                        right.addstr(y, 4, f"Mounted: {mount_point}")
-                        y += 1
-                        right.addstr(y, 4, f"Capacity: {capacity}")
-                        y += 1
-                        right.addstr(y, 4, f"Used: {used}")
-                        y += 1
-                        right.addstr(y, 4, f"Available: {available}")
-                        y += 1
-                    except curses.error:
-                        # Skip if we can't write the information
-                        pass
+                    # Mount point and capacity summary for the last rendered
+                    # LV: mount_point/capacity/used/available from the loop
+                    # above are still current, so reuse them rather than
+                    # rebuilding the path strings and redoing the lookup
+                    put(right, y, 4, f"Mounted: {mount_point}")
+                    y += 1
+                    put(right, y, 4, f"Capacity: {capacity}")
+                    y += 1
+                    put(right, y, 4, f"Used: {used}")
+                    y += 1
+                    put(right, y, 4, f"Available: {available}")
+                    y += 1
                     
                     # Add blank line before tabular data
                     y += 1
@@ -824,156 +1028,26 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                     # Ensure we don't write outside window boundaries
                     if y >= h - 2:
                         break
-                    try:
-                        formatted_header = "{:<10} {:<10} {:>10} {:>10} {:<20} {}".format(
-                            "LE Start", "LE End", "PE Count", "PE Size", "PVs", "PE Start")
-                        # Ensure we don't write beyond window width
-                        max_line_width = vg_width - 6  # Allow for borders and margin
-                        if len(formatted_header) > max_line_width:
-                            formatted_header = formatted_header[:max_line_width]
-                        right.addstr(y, 4, formatted_header, curses.A_UNDERLINE)
-                    except curses.error:
-                        # Skip if we can't write the header (probably out of bounds)
-                        pass
+                    formatted_header = _ROW_FMT(
+                        "LE Start", "LE End", "PE Count", "PE Size", "PVs", "PE Start")
+                    # Ensure we don't write beyond window width
+                    max_line_width = vg_width - 6  # Allow for borders and margin
+                    if len(formatted_header) > max_line_width:
+                        formatted_header = formatted_header[:max_line_width]
+                    put(right, y, 4, formatted_header, curses.A_UNDERLINE)
                     y += 1
-                    for lv in group:
-                        if y >= h - 2:  # Check against full screen height
-                            break
-                        
-                        # Calculate PE count and PE size
-                        pe_count = "N/A"
-                        pe_size = "N/A"
-                        
-                        # Get segment size in PEs
-                        seg_size_pe = lv.get('seg_size_pe', '0')
-                        if seg_size_pe and seg_size_pe != "":
-                            try:
-                                pe_count = int(float(seg_size_pe))
-                                
-                                # Calculate PE size using VG PE size
-                                if vg_pe_size != 'N/A':
-                                    try:
-                                        pe_size_bytes = int(float(vg_pe_size)) * pe_count
-                                        pe_size = format_size(pe_size_bytes)
-                                    except (ValueError, TypeError):
-                                        pe_size = "N/A"
-                            except (ValueError, TypeError):
-                                pe_count = "N/A"
-                        
-                        pvlist = lv.get('devices', '')
-                        
-                        # Get LE start and end values
-                        le_start = "N/A"
-                        le_end = "N/A"
-                        
-                        # First try to get LE start directly from LV metadata
-                        seg_start_pe = lv.get('seg_start_pe')
-                        if seg_start_pe and seg_start_pe != "":
-                            try:
-                                start_le = int(float(seg_start_pe))
-                                le_start = str(start_le)
-                                
-                                # Calculate LE end based on LE start and size
-                                seg_size_pe = lv.get('seg_size_pe', '0')
-                                if seg_size_pe and seg_size_pe != "":
-                                    try:
-                                        le_count = int(float(seg_size_pe))
-                                        le_end = str(start_le + le_count - 1)
-                                    except (ValueError, TypeError):
-                                        le_end = "N/A"
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Fallback: Parse from device string if direct metadata not available
-                        if le_start == "N/A" and pvlist:
-                            # Parse LE start from device string, format is like "/dev/sda1(123)"
-                            # where 123 is the LE start
-                            for pv_segment in pvlist.split(','):
-                                pv_segment = pv_segment.strip()
-                                # Extract LE start from segment
-                                start_pos = pv_segment.find('(')
-                                end_pos = pv_segment.find(')')
-                                if start_pos > 0 and end_pos > start_pos:
-                                    le_start = pv_segment[start_pos+1:end_pos]
-                                    # Calculate LE end based on LE start and size
-                                    try:
-                                        start_le = int(float(le_start))
-                                        # Get segment size in LEs
-                                        seg_size_pe = lv.get('seg_size_pe', '0')
-                                        if seg_size_pe and seg_size_pe != "":
-                                            try:
-                                                le_count = int(float(seg_size_pe))
-                                                le_end = str(start_le + le_count - 1)
-                                            except (ValueError, TypeError):
-                                                le_end = "N/A"
-                                    except (ValueError, TypeError):
-                                        le_end = "N/A"
-                                    break
-                        
-                        # Ensure we don't write outside window boundaries
-                        if y >= h - 2:
-                            break
-                            
-                        # Truncate pvlist if too long to prevent boundary errors
-                        max_width = vg_width - 40  # Reserve space for other columns
-                        if len(pvlist) > max_width:
-                            pvlist = pvlist[:max_width-3] + "..."
-                            
-                        # Extract PE start info and clean device names
-                        clean_pvlist = ""
-                        pe_start_info = ""
-                        
-                        for pv_segment in pvlist.split(','):
-                            pv_segment = pv_segment.strip()
-                            # Extract PE start from segment
-                            start_pos = pv_segment.find('(')
-                            end_pos = pv_segment.find(')')
-                            
-                            if start_pos > 0 and end_pos > start_pos:
-                                # Extract the PE start value
-                                pe_val = pv_segment[start_pos+1:end_pos]
-                                # Add to PE start info
-                                if pe_start_info:
-                                    pe_start_info += ", "
-                                pe_start_info += pe_val
-                                
-                                # Add clean device name without parentheses
-                                if clean_pvlist:
-                                    clean_pvlist += ", "
-                                clean_pvlist += pv_segment[:start_pos]
-                            else:
-                                # No parentheses found, use as is
-                                if clean_pvlist:
-                                    clean_pvlist += ", "
-                                clean_pvlist += pv_segment
-                        
-                        # Truncate if too long
-                        max_dev_width = vg_width - 60  # Reserve space for other columns
-                        if len(clean_pvlist) > max_dev_width:
-                            clean_pvlist = clean_pvlist[:max_dev_width-3] + "..."
-                        
-                        # Format string with boundary check
-                        try:
-                            formatted_str = "{:<10} {:<10} {:>10} {:>10} {:<20} {}".format(
-                                le_start, le_end, str(pe_count), pe_size, clean_pvlist, pe_start_info)
-                            # Ensure we don't write beyond window width
-                            max_line_width = vg_width - 6  # Allow for borders and margin
-                            if len(formatted_str) > max_line_width:
-                                formatted_str = formatted_str[:max_line_width]
-                            right.addstr(y, 4, formatted_str)
-                        except curses.error:
-                            # Skip this line if we can't write it (probably out of bounds)
-                            pass
-                        y += 1
+                    # Clip to the rows that fit before looping
+                    for lv in group[:max(0, h - 2 - y)]:
+                        y = _render_lv_row(right, y, lv, vg_pe_size_int,
+                                           vg_width, h)
                     y += 1
             else:
-                right.addstr(1, 2, f"No LVM info for {path}")
+                put(right, 1, 2, f"No LVM info for {path}")
           
             #------------------------------------------------------------
             # Panel (Top half, right side)
             # Create Physical Volumes panel (right side, top half)
             #------------------------------------------------------------
-            pv_panel = stdscr.derwin(pv_height, pv_width, 0, vg_width)
             pv_panel.box()
             # Highlight panel title when it has focus
             title_attr = curses.A_BOLD if active_panel == 1 else 0
@@ -984,29 +1058,16 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                 pass
             
             dev = devices[current] if devices else {}
-            if isinstance(dev, dict):
-                path = dev.get('path')
-            else:
-                path = dev
-            pv = pvs_map.get(path)
+            path = dev.get('path')
+            pv = dev_to_pv[current] if devices else None
             
             if pv:
                 vg_name = pv.get('vg_name')
-                pvs_in_vg = [p for p in pvs_map.values() if p.get('vg_name') == vg_name]
-                
-                # Calculate LV count per PV
-                pv_lv_count = {}
-                lvs_in_vg = lvs_map.get(vg_name, [])
-                for lv in lvs_in_vg:
-                    lv_devices = lv.get('devices', '')
-                    for dev in lv_devices.split(','):
-                        dev = dev.strip()
-                        if dev:
-                            # Match physical volume names by checking if pv_name is in dev string
-                            for pv_name in pvs_map:
-                                if pv_name in dev:
-                                    pv_lv_count[pv_name] = pv_lv_count.get(pv_name, 0) + 1
+                pvs_in_vg = pvs_by_vg.get(vg_name, [])
                 
+                # LV count per PV, precomputed once above for every VG
+                pv_lv_count = pv_lv_count_map.get(vg_name, {})
+
                 #----------------------------------------------
                 # Table headers
                 # Display PV info in the new panel
@@ -1014,48 +1075,47 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                 try:
                     formatted_header = "{:>2} {:>16} {:>8} {:>10}".format(
                         "Block dev", "Size bin", "LV #", "Free cap")
-                    # Ensure we don't write beyond window width
-                    max_width = pv_width - 4  # Allow for borders and margin
-                    if len(formatted_header) > max_width:
-                        formatted_header = formatted_header[:max_width]
-                    pv_panel.addstr(2, 2, formatted_header, curses.A_UNDERLINE)
-                except curses.error:
+                    # addnstr clips to the panel width in C
+                    pv_panel.addnstr(2, 2, formatted_header, pv_width - 4,
+                                     curses.A_UNDERLINE)
+                except _err:
                     # Skip if we can't write the header
                     pass
                 
                 # Ensure pv_selected stays within valid range
                 if pvs_in_vg:
                     pv_selected = min(pv_selected, len(pvs_in_vg) - 1)
-                
-                for j, p in enumerate(pvs_in_vg):
-                    if j >= pv_height - 2:
-                        break
+
+                # Loop invariants: attribute lookups and width math hoisted
+                # out of the per-row body
+                _a_rev = curses.A_REVERSE
+                _pv_fmt = "{:<15} {:>10} {:>8} {}".format
+                max_pname_width = min(15, pv_width - 25)  # Ensure it fits in the narrower panel
+                max_width = pv_width - 4  # Allow for borders and margin
+                for j, p in enumerate(pvs_in_vg[:max(0, pv_height - 3)]):
                     pname = p.get('pv_name', '')
                     # Truncate pname if too long, accounting for narrower panel
-                    max_pname_width = min(15, pv_width - 25)  # Ensure it fits in the narrower panel
-                    if len(pname) > max_pname_width:
-                        pname = pname[:max_pname_width-3] + "..."
-                        
+                    pname = trunc(pname, max_pname_width)
+
                     psize = format_size(p.get('pv_size'))
                     free = format_size(p.get('pv_free'))
                     lv_count = pv_lv_count.get(pname, 0)
                     
-                    # Only write if we have space in the panel
-                    if j + 2 < pv_height - 1:
-                        # Highlight the selected PV when this panel has focus
-                        attr = curses.A_REVERSE if (j == pv_selected and active_panel == 1) else 0
-                        try:
-                            formatted_str = "{:<15} {:>10} {:>8} {}".format(
-                                pname, psize, lv_count, free)
-                            # Ensure we don't write beyond window width
-                            max_width = pv_width - 4  # Allow for borders and margin
-                            if len(formatted_str) > max_width:
-                                formatted_str = formatted_str[:max_width]
-                            pv_panel.addstr(j + 3, 2, formatted_str, attr)
-                        except curses.error:
-                            # Skip this line if we can't write it
-                            pass
-                else:
+                    # Highlight the selected PV when this panel has focus
+                    attr = _a_rev if (j == pv_selected and active_panel == 1) else 0
+                    try:
+                        formatted_str = _pv_fmt(pname, psize, lv_count, free)
+                        # Ensure we don't write beyond window width
+                        if len(formatted_str) > max_width:
+                            formatted_str = formatted_str[:max_width]
+                        pv_panel.addstr(j + 3, 2, formatted_str, attr)
+                    except _err:
+                        # Skip this line if we can't write it
+                        pass
+                # The break-limited loop's else: clause only ran when every
+                # PV fit in the panel; with the rows pre-sliced instead,
+                # state that gating explicitly
+                if len(pvs_in_vg) < pv_height - 1:
                     try:
                         pv_panel.addstr(10, 1, "[ waiting... ]")
                     except curses.error:
@@ -1067,53 +1127,46 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                 try:
                     formatted_header = "{:>2} {:>16} {:>8} {:>10}".format(
                         "Block dev", "Size bin", "LV #", "Free cap")
-                    # Ensure we don't write beyond window width
-                    max_width = pv_width - 4  # Allow for borders and margin
-                    if len(formatted_header) > max_width:
-                        formatted_header = formatted_header[:max_width]
-                    pv_panel.addstr(2, 2, formatted_header, curses.A_UNDERLINE)
-                except curses.error:
+                    # addnstr clips to the panel width in C
+                    pv_panel.addnstr(2, 2, formatted_header, pv_width - 4,
+                                     curses.A_UNDERLINE)
+                except _err:
                     # Skip if we can't write the header
                     pass
                 
                 # Display all PVs in the system
-                for j, (pv_path, p) in enumerate(pvs_map.items()):
-                    if j >= pv_height - 2:
-                        break
+                _pv_fmt = "{:<15} {:>10} {:>8} {}".format
+                max_pname_width = min(15, pv_width - 25)
+                max_width = pv_width - 4  # Allow for borders and margin
+                visible_pvs = list(pvs_map.items())[:max(0, pv_height - 3)]
+                for j, (pv_path, p) in enumerate(visible_pvs):
                     pname = p.get('pv_name', '')
                     # Ensure pname is displayed for test detection
                     if not pname:
                         pname = pv_path
                     
                     # Truncate pname if too long
-                    max_pname_width = min(15, pv_width - 25)
-                    if len(pname) > max_pname_width:
-                        pname = pname[:max_pname_width-3] + "..."
-                        
+                    pname = trunc(pname, max_pname_width)
+
                     psize = format_size(p.get('pv_size'))
                     free = format_size(p.get('pv_free'))
                     vg = p.get('vg_name', 'N/A')
                     
-                    # Only write if we have space in the panel
-                    if j + 2 < pv_height - 1:
-                        try:
-                            formatted_str = "{:<15} {:>10} {:>8} {}".format(
-                                pname, psize, vg, free)
-                            # Ensure we don't write beyond window width
-                            max_width = pv_width - 4  # Allow for borders and margin
-                            if len(formatted_str) > max_width:
-                                formatted_str = formatted_str[:max_width]
-                            pv_panel.addstr(j + 3, 2, formatted_str)
-                        except curses.error:
-                            # Skip this line if we can't write it
-                            pass
+                    try:
+                        formatted_str = _pv_fmt(pname, psize, vg, free)
+                        # Ensure we don't write beyond window width
+                        if len(formatted_str) > max_width:
+                            formatted_str = formatted_str[:max_width]
+                        pv_panel.addstr(j + 3, 2, formatted_str)
+                    except _err:
+                        # Skip this line if we can't write it
+                        pass
             
             #---------------------------------------------
             # Panel (Bottom half, right side)
             #------------------------------------------------
             
-            # Create Block Devices panel (right side, bottom half)
-            block_dev_panel = stdscr.derwin(block_dev_height, pv_width, pv_height, vg_width)
+            # Block Devices panel (right side, bottom half)
             block_dev_panel.box()
             # Highlight panel title when it has focus
             title_attr = curses.A_BOLD if active_panel == 2 else 0
@@ -1129,12 +1182,10 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                 try:
                     formatted_header = "{:<9} {:>16} {:>6} {:>8} {:>8} {:>9} {:>8}".format(
                         "Device", "Size bin", "Unit", "Part", "Type", "FSinf", "Flags")
-                    # Ensure we don't write beyond window width
-                    max_width = pv_width - 4  # Allow for borders and margin
-                    if len(formatted_header) > max_width:
-                        formatted_header = formatted_header[:max_width]
-                    block_dev_panel.addstr(2, 2, formatted_header, curses.A_UNDERLINE)
-                except curses.error:
+                    # addnstr clips to the panel width in C
+                    block_dev_panel.addnstr(2, 2, formatted_header, pv_width - 4,
+                                            curses.A_UNDERLINE)
+                except _err:
                     # Skip if we can't write the header
                     pass
                 
@@ -1143,149 +1194,100 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
                 start_idx = max(0, min(block_dev_selected, max(0, len(devices) - visible_count)))
                 end_idx = min(start_idx + visible_count, len(devices))
                 
-                for i, dev in enumerate(devices[start_idx:end_idx]):
-                    y_pos = i + 3
-                    if y_pos >= block_dev_height - 1:
-                        break
-                    
-                    # Get device info
-                    if isinstance(dev, dict):
-                        name = dev.get('name', 'Unknown')
-                        size = format_size(dev.get('size', 0))
-                        dev_type = dev.get('type', 'Unknown')
-                        
-                        # Get additional info from fdisk/parted with priority to parted
-                        # Only use fdisk_type_info for Disk column, not fdisk_id_info
-                        disk_type = dev.get('fdisk_type_info', '---')
-                        fs_info = dev.get('gpt_fs_info', '---')
-                        flags_info = dev.get('gpt_df_flagsinfo', '---')
-                        
-                        # Get device size for potential use in flags_info
-                        device_size = format_size(dev.get('size', 0))
-                        
-                        # Determine partition type for Part column
-                        part_type = '---'
-                        
-                        # Get device type and partition type info from various sources
-                        dev_type_value = dev.get('type', '')
-                        fdisk_id = dev.get('fdisk_id_info', '')
-                        gpt_flags = dev.get('gpt_disk_flags_type', '')
-                        
-                        # If it's a disk, display "Disk" in the Part column
-                        if dev_type_value == 'disk':
-                            part_type = 'Disk'
-                        # Check for partition type and set appropriate value
-                        elif dev_type_value == 'part':
-                            # Check for primary partition
-                            if 'primary' in fdisk_id.lower() or 'primary' in gpt_flags.lower():
-                                part_type = 'Pri'
-                            # Check for extended partition
-                            # Check for extended partition to set Part column
-                            elif 'extended' in fdisk_id.lower() or 'extended' in gpt_flags.lower():
-                                part_type = 'Extd'
-                            # Check for logical partition
-                            elif 'logical' in fdisk_id.lower() or 'logical' in gpt_flags.lower():
-                                part_type = 'Logi'
-                            else:
-                                # Default to 'Pri' for regular partitions if type not detected
-                                part_type = 'Pri'
-
-                        # Set Flags to '---' if Unit='part' and Part='Extd', per latest feedback
-                        if dev_type_value == 'part' and part_type == 'Extd':
-                            flags_info = '---'
-                        
-                        if dev.get('gpt_part_table_type', 'N/A') != 'N/A':
-                            disk_type = dev.get('gpt_part_table_type', 'N/A')
-                    else:
-                        name = str(dev)
-                        size = 'N/A'
-                        dev_type = 'Unknown'
-                        part_type = '---'  # Default to '---' for unknown partition types
-                        disk_type = 'N/A'
-                        fs_info = 'N/A'
-                        flags_info = 'N/A'
-                    
-                    # Truncate name if too long
-                    if len(name) > 13:
-                        name = name[:10] + "..."
-                        
-                    # Truncate other fields if too long
-                    if len(part_type) > 6:
-                        part_type = part_type[:5] + "."
-                    if len(disk_type) > 6:
-                        disk_type = disk_type[:5] + "."
-                    if len(fs_info) > 6:
-                        fs_info = fs_info[:5] + "."
-                    if len(flags_info) > 6:
-                        flags_info = flags_info[:5] + "."
-                    if len(dev_type) > 6:
-                        dev_type = dev_type[:5] + "."
-                    
-                    # Uppercase 'lvm' in Flags column if present
-                    if flags_info == 'lvm':
-                        flags_info = 'LVM'
-                        
-                    # Highlight if this is the selected block device
-                    attr = curses.A_REVERSE if (i + start_idx == block_dev_selected and active_panel == 2) else 0
-                    
-                    # Format string safely (with boundary checks)
-                    try:
-                        formatted_str = "{:<15} {:<12} {:<8} {:<8} {:<8} {:<8} {:<8}".format(
-                            name, size, dev_type, part_type, disk_type, fs_info, flags_info)
-                        # Ensure we don't write beyond window width
-                        max_width = pv_width - 4  # Allow for borders and margin
-                        if len(formatted_str) > max_width:
-                            formatted_str = formatted_str[:max_width]
-                        block_dev_panel.addstr(y_pos, 2, formatted_str, attr)
-                    except curses.error:
-                        # Safely handle any curses errors during writing
-                        pass
+                # Loop invariants hoisted out of the per-row body; at most
+                # one row is highlighted, so resolve which one up front
+                _a_rev = curses.A_REVERSE
+                hl = block_dev_selected if active_panel == 2 else -1
+                # No try/except needed per row: visible_count bounds the
+                # row range inside the panel and the cached strings are
+                # already clipped short of the last column, so these
+                # writes cannot hit the curses boundary error
+                for i in range(start_idx, end_idx):
+                    attr = _a_rev if i == hl else 0
+                    block_dev_panel.addstr(i - start_idx + 3, 2,
+                                           block_rows_clipped[i], attr)
             else:
-                try:
+                # Panel geometry is fixed per resize; the message fits
+                # whenever the minimum terminal size check passed, so no
+                # per-frame exception guard is needed
+                if block_dev_height > 1 and pv_width > 30:
                     block_dev_panel.addstr(1, 2, "No block devices available")
-                except curses.error:
-                    # Skip if we can't write the message
-                    pass
 
-            # Refresh screen and handle keyboard input
-            stdscr.refresh()
-            key = stdscr.getch()
-            
-            # Handle panel switching with Tab key
-            if key == 9:  # Tab key
-                active_panel = (active_panel + 1) % 3  # Cycle through 0, 1, 2
-            # Handle navigation in main panel
-            elif active_panel == 0:
-                if key in (curses.KEY_UP, ord('k')) and current > 0:
-                    current -= 1
-                elif key in (curses.KEY_DOWN, ord('j')) and current < len(devices) - 1:
-                    current += 1
-            # Handle navigation in physical volumes panel
-            elif active_panel == 1:
-                dev = devices[current] if devices else {}
-                if isinstance(dev, dict):
-                    path = dev.get('path')
-                else:
-                    path = dev
-                pv = pvs_map.get(path)
-                
-                if pv:
-                    vg_name = pv.get('vg_name')
-                    pvs_in_vg = [p for p in pvs_map.values() if p.get('vg_name') == vg_name]
-                    
-                    if key in (curses.KEY_UP, ord('k')) and pv_selected > 0:
-                        pv_selected -= 1
-                    elif key in (curses.KEY_DOWN, ord('j')) and pv_selected < len(pvs_in_vg) - 1:
-                        pv_selected += 1
-            # Handle navigation in block devices panel
-            elif active_panel == 2:
-                if key in (curses.KEY_UP, ord('k')) and block_dev_selected > 0:
-                    block_dev_selected -= 1
-                elif key in (curses.KEY_DOWN, ord('j')) and block_dev_selected < len(devices) - 1:
-                    block_dev_selected += 1
-            
-            # Global quit key
-            if key in (ord('q'), 27):  # q or ESC to quit
+            # Flush all pending writes in one update rather than per-panel
+            stdscr.noutrefresh()
+            curses.doupdate()
+
+            # Consume keys until one actually changes state, so frames are
+            # only re-rendered when the display would differ
+            while True:
+                key = stdscr.getch()
+                if key == -1:
+                    # getch returns ERR when polled in nodelay/timeout
+                    # mode; nothing happened, so never touch the state
+                    # machine or re-render
+                    continue
+                prev_state = (current, active_panel, pv_selected, block_dev_selected)
+
+                # Handle panel switching with Tab key
+                if key == 9:  # Tab key
+                    active_panel = (active_panel + 1) % 3  # Cycle through 0, 1, 2
+                # Handle navigation in main panel
+                elif active_panel == 0:
+                    if key in (curses.KEY_UP, ord('k')) and current > 0:
+                        current -= 1
+                    elif key in (curses.KEY_DOWN, ord('j')) and current < len(devices) - 1:
+                        current += 1
+                # Handle navigation in physical volumes panel
+                elif active_panel == 1:
+                    pv = dev_to_pv[current] if devices else None
+
+                    if pv:
+                        vg_name = pv.get('vg_name')
+                        pvs_in_vg = pvs_by_vg.get(vg_name, [])
+
+                        if key in (curses.KEY_UP, ord('k')) and pv_selected > 0:
+                            pv_selected -= 1
+                        elif key in (curses.KEY_DOWN, ord('j')) and pv_selected < len(pvs_in_vg) - 1:
+                            pv_selected += 1
+                # Handle navigation in block devices panel
+                elif active_panel == 2:
+                    if key in (curses.KEY_UP, ord('k')) and block_dev_selected > 0:
+                        block_dev_selected -= 1
+                    elif key in (curses.KEY_DOWN, ord('j')) and block_dev_selected < len(devices) - 1:
+                        block_dev_selected += 1
+
+                # Global quit key
+                if key in (ord('q'), 27):  # q or ESC to quit
+                    return
+
+                if (key != curses.KEY_RESIZE and
+                        (current, active_panel, pv_selected, block_dev_selected) == prev_state):
+                    continue
+
+                # Fast path: an arrow move inside panel 2 that doesn't
+                # scroll the list only flips the highlight between two
+                # rows, so repaint just those instead of the whole frame
+                if (key != curses.KEY_RESIZE and devices and active_panel == 2 and
+                        prev_state[:3] == (current, active_panel, pv_selected)):
+                    prev_sel = prev_state[3]
+                    new_start = max(0, min(block_dev_selected,
+                                           max(0, len(devices) - visible_count)))
+                    if (new_start == start_idx and
+                            start_idx <= prev_sel < end_idx and
+                            start_idx <= block_dev_selected < end_idx):
+                        try:
+                            block_dev_panel.addstr(prev_sel - start_idx + 3, 2,
+                                                   block_rows_clipped[prev_sel])
+                            block_dev_panel.addstr(
+                                block_dev_selected - start_idx + 3, 2,
+                                block_rows_clipped[block_dev_selected],
+                                curses.A_REVERSE)
+                            stdscr.noutrefresh()
+                            curses.doupdate()
+                            continue
+                        except _err:
+                            # Fall back to a full repaint on any write error
+                            pass
                 break
                 
         except curses.error as e:
@@ -1319,7 +1321,8 @@ def draw_ui(stdscr, devices, pvs_map, vg_map, lvs_map):
 def main():
     """Main entry point for the application."""
     try:
-        devices, pvs_map, vg_map, lvs_map = load_data()
+        use_cache = '--no-cache' not in sys.argv[1:]
+        devices, pvs_map, vg_map, lvs_map = load_data(use_cache=use_cache)
         if not devices:
             print("No block devices found or permission denied.")
             return